@@ -44,7 +44,8 @@ def init_database():
     """Initialize database with Alembic migrations.
 
     Runs migrations on startup. For existing databases without version info,
-    stamps them with the initial revision to avoid recreating tables.
+    stamps them with the initial revision to avoid recreating tables, then
+    applies any later migrations.
     """
     from backend.models import DatabaseManager
     from backend.paths import DATA_DIR
@@ -67,7 +68,8 @@ def init_database():
             # Existing database without migrations - stamp it with initial revision
             print("INFO [app] Existing database detected without version info")
             print("INFO [app] Stamping database with initial revision")
-            command.stamp(alembic_cfg, "head")
+            command.stamp(alembic_cfg, "1b5a99c3cb8a")
+            command.upgrade(alembic_cfg, "head")
         else:
             # Database has version info or is empty - run normal upgrade
             print("INFO [app] Running database migrations")
@@ -9,7 +9,7 @@ Provides read/write access to persistent settings stored in config.json.
 
 import json
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from backend.paths import DATA_DIR
 
@@ -24,12 +24,15 @@ class ConfigManager:
 
     - Loads config once at startup (or creates a default one).
     - Every `set`/`update` writes the whole file synchronously.
+    - `version` increases on every load or write so callers can cache
+      values derived from the config.
     """
 
     def __init__(self, config_path: Optional[str] = None) -> None:
         # Use DATA_DIR which respects environment variables
         self.config_path = config_path or os.path.join(DATA_DIR, "config.json")
         self._config: Dict[str, Any] = {}
+        self.version = 0
         self.load_config()
 
     # -------------------------------------------------------------------------
@@ -49,6 +52,7 @@ class ConfigManager:
             print(f"Error loading config, using defaults: {e}")
             self._config = self._get_default_config()
             self.save()
+        self.version += 1
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration."""
@@ -116,14 +120,42 @@ class ConfigManager:
         """Get a configuration value."""
         return self._config.get(key, default)
 
+    def get_path(self, path: Sequence[str], default: Any = None) -> Any:
+        """Get a nested configuration value, or ``default`` if any key is missing."""
+        node: Any = self._config
+        for key in path:
+            if not isinstance(node, dict) or key not in node:
+                return default
+            node = node[key]
+        return node
+
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value and immediately save to disk."""
         self._config[key] = value
+        self.version += 1
+        self.save()
+
+    def set_path(self, path: Sequence[str], value: Any) -> None:
+        """Set a nested configuration value and immediately save to disk.
+
+        Intermediate dictionaries are created as needed, so callers do not
+        have to read and re-set a whole top-level subtree for one key.
+        """
+        node = self._config
+        for key in path[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                child = {}
+                node[key] = child
+            node = child
+        node[path[-1]] = value
+        self.version += 1
         self.save()
 
     def update(self, updates: Dict[str, Any]) -> None:
         """Update multiple configuration values and immediately save to disk."""
         self._config.update(updates)
+        self.version += 1
         self.save()
 
     def get_all(self) -> Dict[str, Any]:
@@ -331,17 +331,15 @@ def get_module_config(module_id):
     """Return the configuration dictionary for a single module."""
     if not module_id:
         return {}
-    modules = config_manager.get("modules", {}) or {}
-    return modules.get(module_id, {})
+    return config_manager.get_path(("modules", module_id), {})
 
 
 def set_module_config(module_id, config_dict):
     """Merge ``config_dict`` into the existing module configuration."""
     if not module_id or not isinstance(config_dict, dict):
         return
-    modules = config_manager.get("modules", {}) or {}
-    modules[module_id] = {**modules.get(module_id, {}), **config_dict}
-    config_manager.set("modules", modules)
+    current = config_manager.get_path(("modules", module_id), {})
+    config_manager.set_path(("modules", module_id), {**current, **config_dict})
     print(f"Updated module config for {module_id}")
 
 
@@ -382,9 +380,7 @@ def get_monitoring_polling_rate():
     Returns:
         float: Polling rate in seconds. Defaults to 10.0. Minimum 1.0.
     """
-    rate = (
-        config_manager.get("modules", {}).get("monitor", {}).get("polling_rate", 10.0)
-    )
+    rate = config_manager.get_path(("modules", "monitor", "polling_rate"), 10.0)
     try:
         rate = float(rate)
         return max(1.0, rate)  # Minimum 1 second
@@ -417,10 +413,8 @@ def get_notification_polling_rate():
     Returns:
         float: Polling rate in seconds. Defaults to 60.0. Minimum 1.0.
     """
-    rate = (
-        config_manager.get("modules", {})
-        .get("notifications", {})
-        .get("polling_rate", 60.0)
+    rate = config_manager.get_path(
+        ("modules", "notifications", "polling_rate"), 60.0
     )
     try:
         rate = float(rate)
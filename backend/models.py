@@ -16,6 +16,7 @@ from sqlalchemy import (
     DateTime,
     Text,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
@@ -151,6 +152,11 @@ class Event(Base):
     """System event that can trigger notifications."""
 
     __tablename__ = "events"
+    __table_args__ = (
+        # Serves unacknowledged-first scans ordered by time (delivery worker,
+        # unread count, filtered event list)
+        Index("ix_events_acknowledged_timestamp", "acknowledged", "timestamp"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     timestamp = Column(DateTime, default=datetime.utcnow)
@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import json
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -32,10 +32,11 @@ except Exception:
 
 
 _worker_thread: Optional[threading.Thread] = None
-_monitor_stop_flag = False
 # Tracks previous states per monitor_body.id for detecting state changes
 _previous_states: Dict[int, str] = {}
 _stop_event = threading.Event()
+# Shared pool for querying Docker for several containers at once
+_status_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="monitor")
 
 
 # =============================================================================
@@ -153,7 +154,6 @@ def run_monitoring_cycle() -> None:
     Safe to call ad-hoc (e.g., from cron or tests) and also used by
     the background thread started via start_monitoring_service().
     """
-    global _previous_states
     sm = get_save_manager()
 
     # Degrade gracefully if database layer not initialized
@@ -170,17 +170,38 @@ def run_monitoring_cycle() -> None:
             session.query(MonitorBodies).filter(MonitorBodies.enabled == True).all()
         )
 
+        # Load all referenced containers in one query instead of one per monitor
+        container_ids = {
+            md.container_id
+            for md in monitors
+            if md.monitor_type == "docker" and md.container_id
+        }
+        containers_by_id = {}
+        if container_ids:
+            containers_by_id = {
+                c.id: c
+                for c in session.query(Container).filter(
+                    Container.id.in_(container_ids)
+                )
+            }
+
+        # Docker status checks are blocking API calls, so run them concurrently
+        container_statuses = dict(
+            zip(
+                containers_by_id.keys(),
+                _status_pool.map(
+                    _evaluate_docker_container_status, containers_by_id.values()
+                ),
+            )
+        )
+
         for md in monitors:
             value = "unknown"
             container_name = md.name or f"Monitor {md.id}"
 
             if md.monitor_type == "docker" and md.container_id:
-                cont = (
-                    session.query(Container)
-                    .filter(Container.id == md.container_id)
-                    .first()
-                )
-                value = _evaluate_docker_container_status(cont)
+                cont = containers_by_id.get(md.container_id)
+                value = container_statuses.get(md.container_id, "unknown")
                 if cont:
                     container_name = cont.name or container_name
 
@@ -229,7 +250,6 @@ def run_monitoring_cycle() -> None:
 
 def _monitor_loop() -> None:
     """Background loop that periodically runs the monitoring cycle."""
-    global _monitor_stop_flag
     while not _stop_event.is_set():
         try:
             run_monitoring_cycle()
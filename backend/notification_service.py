@@ -9,9 +9,11 @@ import ssl
 import json
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Any
 
 from backend.models import DatabaseManager, Event, EventDelivery
@@ -22,6 +24,17 @@ from backend.config_manager import config_manager
 
 _worker_thread: Optional[threading.Thread] = None
 _stop_event = threading.Event()
+_db_manager: Optional[DatabaseManager] = None
+# Shared pool for sending one event to several channels at once
+_delivery_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="notif")
+# Enabled channels/rules derived from config, rebuilt when config_manager.version changes
+_routing: Dict[str, Any] = {
+    "version": None,
+    "channels_by_id": {},
+    "rules": [],
+    "severity_range": None,
+    "by_severity": {},
+}
 
 
 # =============================================================================
@@ -31,7 +44,7 @@ _stop_event = threading.Event()
 
 def _get_notification_config() -> Dict:
     """Get the notifications module configuration."""
-    return config_manager.get("modules", {}).get("notifications", {})
+    return config_manager.get_path(("modules", "notifications"), {})
 
 
 def _get_channels() -> List[Dict]:
@@ -45,32 +58,79 @@ def _get_rules() -> List[Dict]:
 
 
 def _get_db() -> DatabaseManager:
-    """Get database manager instance."""
-    return DatabaseManager()
+    """Get or create the database manager instance."""
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
+
+
+def _get_routing() -> Dict[str, Any]:
+    """Get enabled channels by ID and enabled rules, cached per config version."""
+    global _routing
+
+    routing = _routing
+    version = config_manager.version
+    if routing["version"] != version:
+        channels_by_id = {
+            c["id"]: c for c in _get_channels() if c.get("enabled", True)
+        }
+        rules = [
+            r
+            for r in _get_rules()
+            if r.get("enabled", True) and r.get("channel_id") in channels_by_id
+        ]
+        routing = {
+            "version": version,
+            "channels_by_id": channels_by_id,
+            "rules": rules,
+            "severity_range": _get_severity_range(rules),
+            "by_severity": {},
+        }
+        _routing = routing
+    return routing
+
+
+def _get_severity_range(rules: List[Dict]) -> Optional[tuple]:
+    """Get the (min, max) severity any of the rules can match.
+
+    Returns:
+        None if no rule can match, otherwise (min, max) where max is None
+        when at least one rule has no upper bound.
+    """
+    if not rules:
+        return None
+
+    low = min(r.get("min_severity", 1) for r in rules)
+    highs = [r.get("max_severity") for r in rules]
+    high = None if None in highs else max(highs)
+    return low, high
 
 
 def _get_matching_channels(severity: int) -> List[Dict]:
-    """Get all enabled channels matching the given severity level."""
-    channels = _get_channels()
-    rules = _get_rules()
+    """Get all enabled channels matching the given severity level.
 
-    channel_map = {c["id"]: c for c in channels if c.get("enabled", True)}
+    Results are memoized per severity until the config changes.
+    """
+    routing = _get_routing()
+    cached = routing["by_severity"].get(severity)
+    if cached is not None:
+        return cached
 
-    matching_channel_ids = set()
-    for rule in rules:
-        if not rule.get("enabled", True):
-            continue
+    channel_map = routing["channels_by_id"]
 
+    matching_channel_ids = set()
+    for rule in routing["rules"]:
         min_sev = rule.get("min_severity", 1)
         max_sev = rule.get("max_severity")
 
         if severity >= min_sev:
             if max_sev is None or severity <= max_sev:
-                channel_id = rule.get("channel_id")
-                if channel_id in channel_map:
-                    matching_channel_ids.add(channel_id)
+                matching_channel_ids.add(rule.get("channel_id"))
 
-    return [channel_map[cid] for cid in matching_channel_ids]
+    matching = [channel_map[cid] for cid in matching_channel_ids]
+    routing["by_severity"][severity] = matching
+    return matching
 
 
 # =============================================================================
@@ -184,13 +244,15 @@ Message:
 
         if use_ssl:
             # SSL from the start (port 465)
-            with smtplib.SMTP_SSL(smtp_server, smtp_port, context=context) as server:
+            with smtplib.SMTP_SSL(
+                smtp_server, smtp_port, context=context, timeout=10
+            ) as server:
                 if username and password:
                     server.login(username, password)
                 server.sendmail(from_email, to_email, msg.as_string())
         else:
             # STARTTLS (port 587)
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
+            with smtplib.SMTP(smtp_server, smtp_port, timeout=10) as server:
                 if use_tls:
                     server.starttls(context=context)
                 if username and password:
@@ -377,6 +439,18 @@ def record_delivery(
 # =============================================================================
 
 
+def _snapshot_event(event: Event) -> SimpleNamespace:
+    """Copy the fields delivery handlers read into a session-independent object."""
+    return SimpleNamespace(
+        id=event.id,
+        severity=event.severity,
+        source=event.source,
+        title=event.title,
+        message=event.message,
+        timestamp=event.timestamp,
+    )
+
+
 def process_pending_events() -> int:
     """Process all undelivered events.
 
@@ -388,6 +462,12 @@ def process_pending_events() -> int:
     if "notifications" not in enabled_modules:
         return 0
 
+    # Skip the database entirely when no rule can route any event
+    severity_range = _get_routing()["severity_range"]
+    if severity_range is None:
+        return 0
+    min_severity, max_severity = severity_range
+
     db = _get_db()
     session = db.get_session()
     delivery_count = 0
@@ -395,11 +475,19 @@ def process_pending_events() -> int:
     try:
         # Get all unacknowledged events that haven't been processed
         # We'll use EventDelivery to track what's been sent where
-        events = (
-            session.query(Event)
-            .filter(Event.acknowledged == False)
-            .order_by(Event.timestamp.asc())
-            .limit(50)
+        query = session.query(Event).filter(
+            Event.acknowledged == False, Event.severity >= min_severity
+        )
+        if max_severity is not None:
+            query = query.filter(Event.severity <= max_severity)
+        events = query.order_by(Event.timestamp.asc()).limit(50).all()
+        if not events:
+            return 0
+
+        # Fetch every (event, channel) pair already attempted for this batch in one query
+        attempted = set(
+            session.query(EventDelivery.event_id, EventDelivery.channel_id)
+            .filter(EventDelivery.event_id.in_([e.id for e in events]))
             .all()
         )
 
@@ -410,27 +498,34 @@ def process_pending_events() -> int:
             if not matching_channels:
                 continue
 
+            pending = []
             for channel in matching_channels:
                 channel_id = channel.get("id")
 
-                # Check if we've already delivered to this channel (check each time to avoid races)
-                existing = (
-                    session.query(EventDelivery)
-                    .filter(
-                        EventDelivery.event_id == event.id,
-                        EventDelivery.channel_id == channel_id,
-                    )
-                    .first()
-                )
-                if existing:
+                if (event.id, channel_id) in attempted:
                     continue  # Already attempted delivery to this channel
+                attempted.add((event.id, channel_id))
+                pending.append(channel)
+
+            if not pending:
+                continue
 
-                # Attempt delivery
-                result = deliver_to_channel(channel, event)
+            # Send to all channels concurrently. Handlers get a detached copy
+            # of the event so the per-delivery commits below cannot expire it
+            # while another thread is still reading it.
+            snapshot = _snapshot_event(event)
+            futures = {
+                _delivery_pool.submit(deliver_to_channel, channel, snapshot): channel
+                for channel in pending
+            }
+
+            for future in as_completed(futures):
+                channel = futures[future]
+                result = future.result()
                 record_delivery(
                     session,
-                    event.id,
-                    channel_id,
+                    snapshot.id,
+                    channel.get("id"),
                     result["success"],
                     result.get("error"),
                 )
@@ -440,11 +535,11 @@ def process_pending_events() -> int:
 
                 if result["success"]:
                     print(
-                        f"[notification_service] Delivered event {event.id} to channel {channel.get('name')}"
+                        f"[notification_service] Delivered event {snapshot.id} to channel {channel.get('name')}"
                     )
                 else:
                     print(
-                        f"[notification_service] Failed to deliver event {event.id} to channel {channel.get('name')}: {result.get('error')}"
+                        f"[notification_service] Failed to deliver event {snapshot.id} to channel {channel.get('name')}: {result.get('error')}"
                     )
 
     except Exception as e:
@@ -3,8 +3,10 @@
 Handles event listing, acknowledgment, and deletion.
 """
 
+import time
 from datetime import datetime
 from flask import Blueprint, jsonify, request
+from sqlalchemy import func, insert
 
 from backend.models import DatabaseManager, Event, EventDelivery
 
@@ -21,6 +23,40 @@ def get_db():
     return _db_manager
 
 
+# Columns returned by the event listing endpoints. Selecting them directly
+# skips ORM object construction for every listed row.
+_EVENT_COLUMNS = (
+    Event.id,
+    Event.timestamp,
+    Event.severity,
+    Event.source,
+    Event.title,
+    Event.message,
+    Event.object_type,
+    Event.object_id,
+    Event.acknowledged,
+    Event.acknowledged_at,
+)
+
+
+def _event_to_dict(e):
+    """Serialize an event row for the JSON API."""
+    return {
+        "id": e.id,
+        "timestamp": e.timestamp.isoformat() if e.timestamp else None,
+        "severity": e.severity,
+        "source": e.source,
+        "title": e.title,
+        "message": e.message,
+        "object_type": e.object_type,
+        "object_id": e.object_id,
+        "acknowledged": e.acknowledged,
+        "acknowledged_at": (
+            e.acknowledged_at.isoformat() if e.acknowledged_at else None
+        ),
+    }
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Events API (database-backed)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -36,34 +72,18 @@ def get_events():
         limit = request.args.get("limit", 50, type=int)
         offset = request.args.get("offset", 0, type=int)
 
-        query = session.query(Event).order_by(Event.timestamp.desc())
+        query = session.query(*_EVENT_COLUMNS).order_by(Event.timestamp.desc())
 
         if acknowledged is not None:
             ack_bool = acknowledged.lower() in ("true", "1", "yes")
             query = query.filter(Event.acknowledged == ack_bool)
 
-        total = query.count()
+        total = query.with_entities(func.count(Event.id)).order_by(None).scalar()
         events = query.offset(offset).limit(limit).all()
 
         return jsonify(
             {
-                "events": [
-                    {
-                        "id": e.id,
-                        "timestamp": e.timestamp.isoformat() if e.timestamp else None,
-                        "severity": e.severity,
-                        "source": e.source,
-                        "title": e.title,
-                        "message": e.message,
-                        "object_type": e.object_type,
-                        "object_id": e.object_id,
-                        "acknowledged": e.acknowledged,
-                        "acknowledged_at": (
-                            e.acknowledged_at.isoformat() if e.acknowledged_at else None
-                        ),
-                    }
-                    for e in events
-                ],
+                "events": [_event_to_dict(e) for e in events],
                 "total": total,
                 "limit": limit,
                 "offset": offset,
@@ -79,7 +99,11 @@ def get_unread_count():
     db = get_db()
     session = db.get_session()
     try:
-        count = session.query(Event).filter(Event.acknowledged == False).count()
+        count = (
+            session.query(func.count(Event.id))
+            .filter(Event.acknowledged == False)
+            .scalar()
+        )
         return jsonify({"count": count})
     finally:
         db.close_session(session)
@@ -161,32 +185,14 @@ def get_last_events_by_container_id(container_id, count):
     session = db.get_session()
     try:
         events = (
-            session.query(Event)
+            session.query(*_EVENT_COLUMNS)
             .filter(Event.object_type == "container", Event.object_id == container_id)
             .order_by(Event.timestamp.desc())
             .limit(count)
             .all()
         )
 
-        return jsonify(
-            [
-                {
-                    "id": e.id,
-                    "timestamp": e.timestamp.isoformat() if e.timestamp else None,
-                    "severity": e.severity,
-                    "source": e.source,
-                    "title": e.title,
-                    "message": e.message,
-                    "object_type": e.object_type,
-                    "object_id": e.object_id,
-                    "acknowledged": e.acknowledged,
-                    "acknowledged_at": (
-                        e.acknowledged_at.isoformat() if e.acknowledged_at else None
-                    ),
-                }
-                for e in events
-            ]
-        )
+        return jsonify([_event_to_dict(e) for e in events])
     finally:
         db.close_session(session)
 
@@ -197,32 +203,14 @@ def get_last_events_by_vm_id(vm_id, count):
     session = db.get_session()
     try:
         events = (
-            session.query(Event)
+            session.query(*_EVENT_COLUMNS)
             .filter(Event.object_type == "vm", Event.object_id == vm_id)
             .order_by(Event.timestamp.desc())
             .limit(count)
             .all()
         )
 
-        return jsonify(
-            [
-                {
-                    "id": e.id,
-                    "timestamp": e.timestamp.isoformat() if e.timestamp else None,
-                    "severity": e.severity,
-                    "source": e.source,
-                    "title": e.title,
-                    "message": e.message,
-                    "object_type": e.object_type,
-                    "object_id": e.object_id,
-                    "acknowledged": e.acknowledged,
-                    "acknowledged_at": (
-                        e.acknowledged_at.isoformat() if e.acknowledged_at else None
-                    ),
-                }
-                for e in events
-            ]
-        )
+        return jsonify([_event_to_dict(e) for e in events])
     finally:
         db.close_session(session)
 
@@ -233,55 +221,98 @@ def get_last_events_by_vm_id(vm_id, count):
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@event_bp.route("/api/notifications/test", methods=["POST"])
-def create_test_event():
-    """Create a test notification event."""
-    data = request.get_json() or {}
+def _parse_test_event(data):
+    """Apply defaults to a test event spec and validate its severity.
 
+    Raises:
+        ValueError: If severity is not a positive integer.
+    """
     severity = data.get("severity", 2)
-    source = data.get("source", "test")
-    title = data.get("title", "Test Notification")
-    message = data.get("message", "This is a test notification message.")
-
     try:
         severity = int(severity)
-        if severity < 1:
-            raise ValueError()
     except (ValueError, TypeError):
-        return jsonify({"error": "severity must be a positive integer"}), 400
+        raise ValueError("severity must be a positive integer")
+    if severity < 1:
+        raise ValueError("severity must be a positive integer")
+
+    return {
+        "severity": severity,
+        "source": data.get("source", "test"),
+        "title": data.get("title", "Test Notification"),
+        "message": data.get("message", "This is a test notification message."),
+    }
+
+
+def create_test_events_bulk(specs):
+    """Create test events in a single INSERT.
+
+    Each spec accepts the same fields as /api/notifications/test.
+
+    Returns:
+        List of the new event IDs, in spec order.
+
+    Raises:
+        ValueError: If a spec is not a dict or has an invalid severity.
+    """
+    parsed = []
+    for i, spec in enumerate(specs):
+        if not isinstance(spec, dict):
+            raise ValueError(f"event {i} must be an object")
+        try:
+            parsed.append(_parse_test_event(spec))
+        except ValueError as e:
+            raise ValueError(f"event {i}: {e}")
+
+    base_ns = time.time_ns()
+    now = datetime.utcfromtimestamp(base_ns / 1e9)
+    rows = [
+        {
+            **spec,
+            "fingerprint": f"{spec['source']}:{spec['title']}:{base_ns + i}",
+            "timestamp": now,
+            "acknowledged": False,
+        }
+        for i, spec in enumerate(parsed)
+    ]
+    if not rows:
+        return []
 
     db = get_db()
     session = db.get_session()
     try:
-        fingerprint = f"{source}:{title}:{datetime.utcnow().strftime('%Y%m%d%H%M%S%f')}"
-
-        event = Event(
-            severity=severity,
-            source=source,
-            title=title,
-            message=message,
-            fingerprint=fingerprint,
-            timestamp=datetime.utcnow(),
-            acknowledged=False,
-        )
-
-        session.add(event)
+        ids = session.scalars(
+            insert(Event).returning(Event.id, sort_by_parameter_order=True), rows
+        ).all()
         session.commit()
-
-        return (
-            jsonify(
-                {
-                    "message": "Test event created",
-                    "event": {
-                        "id": event.id,
-                        "severity": event.severity,
-                        "source": event.source,
-                        "title": event.title,
-                        "message": event.message,
-                    },
-                }
-            ),
-            201,
-        )
+        return ids
     finally:
         db.close_session(session)
+
+
+@event_bp.route("/api/notifications/test", methods=["POST"])
+def create_test_event():
+    """Create a test notification event."""
+    data = request.get_json() or {}
+
+    try:
+        spec = _parse_test_event(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    (event_id,) = create_test_events_bulk([spec])
+
+    return (
+        jsonify(
+            {
+                "message": "Test event created",
+                "event": {
+                    "id": event_id,
+                    "severity": spec["severity"],
+                    "source": spec["source"],
+                    "title": spec["title"],
+                    "message": spec["message"],
+                },
+            }
+        ),
+        201,
+    )
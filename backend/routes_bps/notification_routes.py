@@ -22,14 +22,12 @@ notification_bp = Blueprint("notification", __name__)
 
 def _get_notification_config():
     """Get the notifications module configuration."""
-    return config_manager.get("modules", {}).get("notifications", {})
+    return config_manager.get_path(("modules", "notifications"), {})
 
 
 def _save_notification_config(notif_config):
     """Save the notifications module configuration."""
-    modules = config_manager.get("modules", {})
-    modules["notifications"] = notif_config
-    config_manager.set("modules", modules)
+    config_manager.set_path(("modules", "notifications"), notif_config)
 
 
 def _get_channels():
@@ -39,9 +37,7 @@ def _get_channels():
 
 def _save_channels(channels):
     """Save notification channels."""
-    notif_config = _get_notification_config()
-    notif_config["channels"] = channels
-    _save_notification_config(notif_config)
+    config_manager.set_path(("modules", "notifications", "channels"), channels)
 
 
 def _get_rules():
@@ -51,9 +47,7 @@ def _get_rules():
 
 def _save_rules(rules):
     """Save delivery rules."""
-    notif_config = _get_notification_config()
-    notif_config["rules"] = rules
-    _save_notification_config(notif_config)
+    config_manager.set_path(("modules", "notifications", "rules"), rules)
 
 
 def _next_channel_id():
@@ -164,12 +158,12 @@ def delete_channel(channel_id):
     if len(channels) == original_len:
         return jsonify({"error": "Channel not found"}), 404
 
-    _save_channels(channels)
-
-    # Also delete associated rules
-    rules = _get_rules()
-    rules = [r for r in rules if r.get("channel_id") != channel_id]
-    _save_rules(rules)
+    # Also delete associated rules, saving both lists in one write
+    rules = [r for r in _get_rules() if r.get("channel_id") != channel_id]
+    notif_config = _get_notification_config()
+    notif_config["channels"] = channels
+    notif_config["rules"] = rules
+    _save_notification_config(notif_config)
 
     return jsonify({"message": "Channel deleted"})
 
@@ -233,13 +227,11 @@ def test_channel(channel_id):
 def get_rules():
     """Return all notification rules with channel info."""
     rules = _get_rules()
-    channels = _get_channels()
+    channels_by_id = {c.get("id"): c for c in _get_channels()}
 
     result = []
     for r in rules:
-        channel = next(
-            (c for c in channels if c.get("id") == r.get("channel_id")), None
-        )
+        channel = channels_by_id.get(r.get("channel_id"))
         result.append(
             {
                 "id": r.get("id"),